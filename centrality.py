@@ -15,7 +15,12 @@ This implementation follows the exact specification:
 ANY CHANGE REQUIRES A PROTOCOL FORK.
 """
 
-import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # e.g. no numba wheel for this Python; use the NumPy path
+    njit = None
 
 
 # ============================================================
@@ -25,6 +30,13 @@ TOLERANCE = 1e-6
 MAX_ITERATIONS = 1000
 # ============================================================
 
+# Above this many agents the matrix is kept in sparse CSR form
+SPARSE_THRESHOLD = 64
+
+# Below this many agents BLAS call overhead outweighs the matvec itself,
+# so the compiled numba kernel is used instead
+SMALL_N_AGENTS = 50
+
 
 def eigenvector_centrality(matrix, tolerance=TOLERANCE, max_iter=MAX_ITERATIONS):
     """
@@ -32,7 +44,7 @@ def eigenvector_centrality(matrix, tolerance=TOLERANCE, max_iter=MAX_ITERATIONS)
     
     Parameters:
     -----------
-    matrix : list[list[float]]
+    matrix : list[list[float]] or numpy.ndarray
         Adjacency matrix where matrix[i][j] = weight of edge i -> j
     tolerance : float
         Convergence tolerance (IMMUTABLE: 1e-6)
@@ -54,46 +66,139 @@ def eigenvector_centrality(matrix, tolerance=TOLERANCE, max_iter=MAX_ITERATIONS)
     if n == 0:
         return []
     
-    # Transpose matrix for incoming edges (who points to me)
-    # For directed graphs, eigenvector centrality typically uses
-    # the transpose to measure "importance based on who links to you"
-    transposed = [[matrix[j][i] for j in range(n)] for i in range(n)]
+    matrix = np.ascontiguousarray(np.asarray(matrix, dtype=np.float64))
+    
+    if _power_iterate is not None and n < SMALL_N_AGENTS:
+        transposed = np.empty_like(matrix)
+        _transpose_tiled(matrix, transposed)
+        scores = _power_iterate(transposed, tolerance, max_iter)
+        return scores.tolist()
+    
+    return _power_iteration(matrix, tolerance, max_iter)
+
+
+def _power_iteration(matrix, tolerance, max_iter):
+    """
+    Run the power iteration on the adjacency matrix (rows=from, cols=to).
+    
+    matrix may be a dense ndarray or a scipy.sparse matrix;
+    only the matvec differs between the two.
+    """
+    n = matrix.shape[0]
+    
+    # Incoming edges (who points to me): for directed graphs, eigenvector
+    # centrality typically uses the transpose to measure "importance based
+    # on who links to you". matrix.T is a view for both ndarray and CSR.
+    transposed = matrix.T
     
-    # Initialize scores uniformly
-    scores = [1.0 / n] * n
+    if isinstance(matrix, np.ndarray):
+        # Dense: write into the preallocated buffer
+        def matvec(x, out):
+            return np.dot(transposed, x, out=out)
+    else:
+        # Sparse SpMV has no out= and returns a fresh array
+        def matvec(x, out):
+            return transposed.dot(x)
+    
+    # Initialize scores uniformly; buffers are reused across iterations
+    scores = np.full(n, 1.0 / n)
+    new_scores = np.empty(n)
+    delta = np.empty(n)
     
     for iteration in range(max_iter):
         # Power iteration step
-        new_scores = [0.0] * n
-        
-        for i in range(n):
-            for j in range(n):
-                new_scores[i] += transposed[i][j] * scores[j]
+        new_scores = matvec(scores, new_scores)
         
         # Normalize
-        norm = math.sqrt(sum(s * s for s in new_scores))
+        norm = np.linalg.norm(new_scores)
         if norm > 0:
-            new_scores = [s / norm for s in new_scores]
+            new_scores /= norm
         else:
             # No edges, return uniform
             return [1.0 / n] * n
         
         # Check convergence
-        diff = sum(abs(new_scores[i] - scores[i]) for i in range(n))
+        np.subtract(new_scores, scores, out=delta)
+        np.abs(delta, out=delta)
+        diff = delta.sum()
         
         if diff < tolerance:
             break
         
-        scores = new_scores
+        scores, new_scores = new_scores, scores
     
     # Normalize so max = 1 (Protocol Law)
-    max_score = max(scores) if scores else 1.0
+    max_score = scores.max()
     if max_score > 0:
-        scores = [s / max_score for s in scores]
+        scores = scores / max_score
+    
+    return scores.tolist()
+
+
+def _power_iterate_kernel(transposed, tolerance, max_iter):
+    """
+    Same algorithm as _power_iteration, written as explicit loops over
+    the contiguous transpose for numba to compile.
+    
+    Returns the normalized scores as an ndarray.
+    """
+    n = transposed.shape[0]
+    scores = np.full(n, 1.0 / n)
+    new_scores = np.empty(n)
+    
+    for iteration in range(max_iter):
+        norm = 0.0
+        for i in range(n):
+            total = 0.0
+            for j in range(n):
+                total += transposed[i, j] * scores[j]
+            new_scores[i] = total
+            norm += total * total
+        norm = np.sqrt(norm)
+        
+        if norm == 0.0:
+            return np.full(n, 1.0 / n)
+        
+        diff = 0.0
+        for i in range(n):
+            new_scores[i] /= norm
+            diff += abs(new_scores[i] - scores[i])
+        
+        if diff < tolerance:
+            break
+        
+        scores, new_scores = new_scores, scores
+    
+    max_score = scores.max()
+    if max_score > 0:
+        scores = scores / max_score
     
     return scores
 
 
+def _transpose_tiled_kernel(matrix, transposed):
+    """
+    Write matrix.T into transposed in 32x32 tiles, so both the source
+    rows and destination columns of a tile stay in cache.
+    """
+    n = matrix.shape[0]
+    block = 32
+    
+    for ii in range(0, n, block):
+        for jj in range(0, n, block):
+            for i in range(ii, min(ii + block, n)):
+                for j in range(jj, min(jj + block, n)):
+                    transposed[j, i] = matrix[i, j]
+
+
+if njit is not None:
+    _power_iterate = njit(cache=True, fastmath=True)(_power_iterate_kernel)
+    _transpose_tiled = njit(cache=True)(_transpose_tiled_kernel)
+else:
+    _power_iterate = None
+    _transpose_tiled = None
+
+
 def compute_scores(adjacency, agents):
     """
     Compute centrality scores for all agents.
@@ -110,10 +215,14 @@ def compute_scores(adjacency, agents):
     dict
         Mapping of agent_id -> score (0.0 to 1.0)
     """
-    from graph import to_adjacency_matrix
+    from graph import to_adjacency_matrix, to_adjacency_matrix_sparse
     
-    matrix, agent_index = to_adjacency_matrix(adjacency, agents)
-    scores = eigenvector_centrality(matrix)
+    if len(agents) > SPARSE_THRESHOLD:
+        matrix, agent_index = to_adjacency_matrix_sparse(adjacency, agents)
+        scores = _power_iteration(matrix, TOLERANCE, MAX_ITERATIONS)
+    else:
+        matrix, agent_index = to_adjacency_matrix(adjacency, agents)
+        scores = eigenvector_centrality(matrix)
     
     # Map back to agent IDs
     result = {}
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Message Codec
+=============
+JSON encoding for messages exchanged between server and nodes.
+
+Uses orjson when available, falling back to the stdlib json module.
+"""
+
+try:
+    import orjson
+
+    def json_dumps(obj):
+        # OPT_NON_STR_KEYS accepts the same non-str dict keys as json.dumps;
+        # orjson returns bytes, so decode to keep frames sent as text
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional
+    import json
+
+    json_dumps = json.dumps
+    json_loads = json.loads
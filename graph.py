@@ -12,7 +12,25 @@ Includes:
 """
 
 import re
-from collections import defaultdict
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+
+_MENTION_RE = re.compile(r"@(\w+)")
+
+# (keyword, pattern) pairs; the lowercase keyword is a cheap substring
+# check that lets messages without the section skip the regex scan
+_INTEGRATION_RES = [
+    (keyword, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+    for keyword, pattern in [
+        ("integration", r"Integration[:\s]*\n(.*?)(?=\n#|\n\n\n|\Z)"),
+        ("builds upon", r"Builds upon[:\s]*(.*?)(?=\n|\Z)"),
+        ("references", r"References[:\s]*(.*?)(?=\n|\Z)"),
+    ]
+]
 
 
 def extract_mentions(content):
@@ -20,8 +38,7 @@ def extract_mentions(content):
     Extract @mentions from message content.
     Returns list of mentioned agent IDs.
     """
-    pattern = r"@(\w+)"
-    return re.findall(pattern, content)
+    return _MENTION_RE.findall(content)
 
 
 def extract_integration_section(content):
@@ -29,16 +46,16 @@ def extract_integration_section(content):
     Extract mentions from Integration section specifically.
     Integration sections indicate structural dependency.
     """
-    # Look for Integration section
-    patterns = [
-        r"Integration[:\s]*\n(.*?)(?=\n#|\n\n\n|\Z)",
-        r"Builds upon[:\s]*(.*?)(?=\n|\Z)",
-        r"References[:\s]*(.*?)(?=\n|\Z)",
-    ]
+    # Case-insensitive regex matching also folds a few non-ASCII
+    # characters onto ASCII letters, so only prefilter ASCII content
+    lowered = content.lower() if content.isascii() else None
     
+    # Look for Integration section
     integration_content = ""
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    for keyword, pattern in _INTEGRATION_RES:
+        if lowered is not None and keyword not in lowered:
+            continue
+        match = pattern.search(content)
         if match:
             integration_content += match.group(1) + " "
     
@@ -52,17 +69,26 @@ def detect_mutual_references(adjacency):
     
     Returns list of (agent_a, agent_b) pairs.
     """
-    mutual = []
-    checked = set()
-    
-    for a, targets in adjacency.items():
-        for b in targets:
-            if (b, a) not in checked:
-                if b in adjacency and a in adjacency[b]:
-                    mutual.append((a, b))
-                checked.add((a, b))
-    
-    return mutual
+    # Each mutual pair is reported once, from whichever side comes first
+    # in adjacency, so no set of already-checked pairs is needed
+    # (insertion order also works for IDs that can't be compared, e.g. None)
+    order = {agent: i for i, agent in enumerate(adjacency)}
+    return [
+        (a, b)
+        for a, targets in adjacency.items()
+        for b in targets
+        if order[a] < order.get(b, -1) and a in adjacency[b]
+    ]
+
+
+def _component_labels(adjacency, agents):
+    """
+    Label connected components (treating graph as undirected).
+    Returns (labels, agent_index); labels[agent_index[a]] is a's component.
+    """
+    matrix, agent_index = to_adjacency_matrix_sparse(adjacency, agents)
+    _, labels = csgraph.connected_components(matrix, directed=False)
+    return labels, agent_index
 
 
 def compute_connected_components(adjacency, agents):
@@ -70,30 +96,17 @@ def compute_connected_components(adjacency, agents):
     Compute connected components (treating graph as undirected).
     Returns list of components, each component is a set of agents.
     """
-    # Build undirected adjacency
-    undirected = defaultdict(set)
-    for a, targets in adjacency.items():
-        for b in targets:
-            undirected[a].add(b)
-            undirected[b].add(a)
-    
-    visited = set()
-    components = []
-    
-    def dfs(node, component):
-        visited.add(node)
-        component.add(node)
-        for neighbor in undirected.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor, component)
+    if not agents:
+        return []
+    
+    labels, agent_index = _component_labels(adjacency, agents)
     
+    # Group agents by label, in order of first appearance
+    components = {}
     for agent in agents:
-        if agent not in visited:
-            component = set()
-            dfs(agent, component)
-            components.append(component)
+        components.setdefault(labels[agent_index[agent]], set()).add(agent)
     
-    return components
+    return list(components.values())
 
 
 def largest_component_ratio(adjacency, agents):
@@ -108,12 +121,8 @@ def largest_component_ratio(adjacency, agents):
     if not agents:
         return 0.0
     
-    components = compute_connected_components(adjacency, agents)
-    if not components:
-        return 0.0
-    
-    largest = max(len(c) for c in components)
-    return largest / len(agents)
+    labels, _ = _component_labels(adjacency, agents)
+    return int(np.bincount(labels).max()) / len(agents)
 
 
 def build_graph(messages):
@@ -129,8 +138,8 @@ def build_graph(messages):
     - Multiple messages = multiple edges (frequency)
     - Integration section mentions are weighted equally
     """
-    # adjacency[from_agent][to_agent] = count
-    adjacency = defaultdict(lambda: defaultdict(int))
+    # edge_counts[(from_agent, to_agent)] = count
+    edge_counts = Counter()
     
     # Track all agents
     all_agents = set()
@@ -145,7 +154,7 @@ def build_graph(messages):
         all_agents.add(from_agent)
         
         # Extract all mentions
-        mentions = extract_mentions(content)
+        mentions = _MENTION_RE.findall(content)
         
         # Extract integration section mentions (for observation)
         integration_mentions = extract_integration_section(content)
@@ -156,17 +165,22 @@ def build_graph(messages):
             })
         
         # Remove duplicates within same message
-        unique_mentions = set(mentions)
+        # (zero or one mention needs no dedup)
+        if len(mentions) > 1:
+            mentions = dict.fromkeys(mentions)
         
-        # Remove self-mentions
-        unique_mentions.discard(from_agent)
-        
-        # Add edges
-        for mentioned in unique_mentions:
-            all_agents.add(mentioned)
-            adjacency[from_agent][mentioned] += 1
+        # Add edges, skipping self-mentions
+        for mentioned in mentions:
+            if mentioned != from_agent:
+                all_agents.add(mentioned)
+                edge_counts[(from_agent, mentioned)] += 1
+    
+    # Pivot to adjacency[from_agent][to_agent] = count
+    adjacency = {}
+    for (from_agent, to_agent), count in edge_counts.items():
+        adjacency.setdefault(from_agent, {})[to_agent] = count
     
-    return dict(adjacency), list(all_agents)
+    return adjacency, list(all_agents)
 
 
 def to_adjacency_matrix(adjacency, agents):
@@ -174,22 +188,79 @@ def to_adjacency_matrix(adjacency, agents):
     Convert adjacency list to matrix.
     
     Returns:
-    - matrix: 2D list (rows=from, cols=to)
+    - matrix: 2D numpy.ndarray (rows=from, cols=to)
     - agent_index: dict mapping agent_id to index
     """
     n = len(agents)
     agent_index = {agent: i for i, agent in enumerate(agents)}
     
-    matrix = [[0] * n for _ in range(n)]
+    rows, cols, data = [], [], []
+    for from_agent, targets in adjacency.items():
+        i = agent_index.get(from_agent)
+        if i is None:
+            continue
+        for to_agent, count in targets.items():
+            j = agent_index.get(to_agent)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+                data.append(count)
+    
+    # Each (from, to) pair is unique, so a plain scatter is enough
+    matrix = np.zeros((n, n), dtype=np.float64)
+    matrix[
+        np.fromiter(rows, dtype=np.int64, count=len(rows)),
+        np.fromiter(cols, dtype=np.int64, count=len(cols)),
+    ] = np.fromiter(data, dtype=np.float64, count=len(data))
+    
+    return matrix, agent_index
+
+
+def to_adjacency_matrix_sparse(adjacency, agents):
+    """
+    Convert adjacency list to a sparse CSR matrix.
+    
+    Storage and matvec cost scale with the number of edges rather
+    than n^2, which suits chat graphs where most agents never
+    mention most others.
     
+    Returns:
+    - matrix: scipy.sparse.csr_matrix (rows=from, cols=to)
+    - agent_index: dict mapping agent_id to index
+    """
+    n = len(agents)
+    agent_index = {agent: i for i, agent in enumerate(agents)}
+    
+    # Group (col, count) entries by row
+    row_entries = [[] for _ in range(n)]
     for from_agent, targets in adjacency.items():
         i = agent_index.get(from_agent)
         if i is None:
             continue
+        row = row_entries[i]
         for to_agent, count in targets.items():
             j = agent_index.get(to_agent)
             if j is not None:
-                matrix[i][j] = count
+                row.append((j, count))
+    
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, row in enumerate(row_entries):
+        row.sort()
+        for j, count in row:
+            indices.append(j)
+            data.append(count)
+        indptr[i + 1] = len(indices)
+    
+    matrix = sparse.csr_matrix(
+        (
+            np.asarray(data, dtype=np.float64),
+            np.asarray(indices, dtype=np.int64),
+            indptr,
+        ),
+        shape=(n, n),
+    )
     
     return matrix, agent_index
 
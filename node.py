@@ -9,10 +9,11 @@ Run: python node.py --id AgentName
 """
 
 import asyncio
-import json
 import argparse
 import websockets
 
+from codec import json_dumps, json_loads
+
 
 class AgentNode:
     """A P2P agent node."""
@@ -34,7 +35,7 @@ class AgentNode:
         self.websocket = await websockets.connect(self.server_url)
         
         # Register with server
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(json_dumps({
             "type": "register",
             "agent_id": self.agent_id,
             "capabilities": self.capabilities
@@ -44,7 +45,7 @@ class AgentNode:
     
     async def send_message(self, to_agent, content):
         """Send a direct message to another agent."""
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(json_dumps({
             "type": "message",
             "from": self.agent_id,
             "to": to_agent,
@@ -62,7 +63,7 @@ class AgentNode:
     
     async def broadcast(self, content):
         """Broadcast a message to all agents."""
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(json_dumps({
             "type": "broadcast",
             "from": self.agent_id,
             "content": content
@@ -70,14 +71,14 @@ class AgentNode:
     
     async def get_graph_data(self):
         """Request graph data from server."""
-        await self.websocket.send(json.dumps({
+        await self.websocket.send(json_dumps({
             "type": "get_graph"
         }))
     
     async def listen(self):
         """Listen for incoming messages."""
         async for message in self.websocket:
-            data = json.loads(message)
+            data = json_loads(message)
             msg_type = data.get("type")
             
             if msg_type == "agent_list":
@@ -115,9 +116,17 @@ class AgentNode:
                 print(f"[{self.agent_id}] Broadcast from {from_agent}: {content}")
             
             elif msg_type == "graph_data":
-                messages = data.get("messages", [])
-                print(f"[{self.agent_id}] Graph data: {len(messages)} messages")
-                return messages
+                # Rebuild the adjacency dict expected by centrality.compute_scores()
+                adjacency = {}
+                edges = data.get("edges", [])
+                for from_agent, to_agent, count in edges:
+                    adjacency.setdefault(from_agent, {})[to_agent] = count
+                agents = data.get("agents", [])
+                print(f"[{self.agent_id}] Graph data: {len(agents)} agents, {len(edges)} edges")
+                scores = data.get("scores", {})
+                for agent, score in sorted(scores.items(), key=lambda x: x[1], reverse=True):
+                    print(f"  {agent}: {score:.4f}")
+                return adjacency, agents
     
     async def run(self):
         """Main run loop."""
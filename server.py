@@ -9,15 +9,22 @@ Run: python server.py
 """
 
 import asyncio
-import json
 import websockets
+from websockets import broadcast as ws_broadcast
+from collections import Counter
 from datetime import datetime
 
+from centrality import compute_scores
+from codec import json_dumps, json_loads
+from graph import extract_mentions
+
 # Connected agents
 agents = {}
 
-# Message log for graph construction
-message_log = []
+# Collaboration graph, updated as messages arrive
+# edge_counts[(from_agent, to_agent)] = count
+edge_counts = Counter()
+graph_agents = set()
 
 
 async def handler(websocket, path):
@@ -26,7 +33,7 @@ async def handler(websocket, path):
     
     try:
         async for message in websocket:
-            data = json.loads(message)
+            data = json_loads(message)
             msg_type = data.get("type")
             
             if msg_type == "register":
@@ -40,7 +47,7 @@ async def handler(websocket, path):
                 print(f"[+] Agent joined: {agent_id}")
                 
                 # Notify all agents of new member
-                await broadcast({
+                broadcast({
                     "type": "agent_joined",
                     "agent_id": agent_id,
                     "capabilities": data.get("capabilities", [])
@@ -51,7 +58,7 @@ async def handler(websocket, path):
                     {"agent_id": aid, "capabilities": info["capabilities"]}
                     for aid, info in agents.items()
                 ]
-                await websocket.send(json.dumps({
+                await websocket.send(json_dumps({
                     "type": "agent_list",
                     "agents": agent_list
                 }))
@@ -62,17 +69,12 @@ async def handler(websocket, path):
                 from_agent = data.get("from", agent_id)
                 content = data.get("content", "")
                 
-                # Log for graph construction
-                message_log.append({
-                    "from": from_agent,
-                    "to": to_agent,
-                    "content": content,
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                # Update the collaboration graph
+                record_edges(from_agent, content)
                 
                 # Forward message
                 if to_agent in agents:
-                    await agents[to_agent]["websocket"].send(json.dumps({
+                    await agents[to_agent]["websocket"].send(json_dumps({
                         "type": "message",
                         "from": from_agent,
                         "content": content
@@ -84,7 +86,7 @@ async def handler(websocket, path):
                 from_agent = data.get("from", agent_id)
                 content = data.get("content", "")
                 
-                await broadcast({
+                broadcast({
                     "type": "broadcast",
                     "from": from_agent,
                     "content": content
@@ -92,10 +94,25 @@ async def handler(websocket, path):
                 print(f"[*] {from_agent} broadcast: {content[:50]}...")
             
             elif msg_type == "get_graph":
-                # Return message log for graph construction
-                await websocket.send(json.dumps({
+                # Snapshot the graph, then compute scores on a worker
+                # thread so the power iteration doesn't stall other agents
+                agent_snapshot = list(graph_agents)
+                adjacency = {}
+                edges = []
+                for (from_agent, to_agent), count in edge_counts.items():
+                    adjacency.setdefault(from_agent, {})[to_agent] = count
+                    edges.append([from_agent, to_agent, count])
+                
+                scores = await asyncio.get_running_loop().run_in_executor(
+                    None, compute_scores, adjacency, agent_snapshot
+                )
+                
+                # Return the collaboration graph as (from, to, count) edges
+                await websocket.send(json_dumps({
                     "type": "graph_data",
-                    "messages": message_log
+                    "agents": agent_snapshot,
+                    "edges": edges,
+                    "scores": scores
                 }))
     
     except websockets.exceptions.ConnectionClosed:
@@ -105,21 +122,48 @@ async def handler(websocket, path):
         if agent_id and agent_id in agents:
             del agents[agent_id]
             print(f"[-] Agent left: {agent_id}")
-            await broadcast({
+            broadcast({
                 "type": "agent_left",
                 "agent_id": agent_id
             })
 
 
-async def broadcast(message, exclude=None):
+def record_edges(from_agent, content):
+    """
+    Add one direct message to the collaboration graph.
+    Same edge rules as graph.build_graph().
+    """
+    # Unregistered connections can send without a "from"; there is no
+    # agent to score, and a None key would break the scores payload
+    if from_agent is None:
+        return
+    
+    graph_agents.add(from_agent)
+    
+    mentions = extract_mentions(content)
+    
+    # Remove duplicates within same message
+    if len(mentions) > 1:
+        mentions = dict.fromkeys(mentions)
+    
+    # Add edges, skipping self-mentions
+    for mentioned in mentions:
+        if mentioned != from_agent:
+            graph_agents.add(mentioned)
+            edge_counts[(from_agent, mentioned)] += 1
+
+
+def broadcast(message, exclude=None):
     """Broadcast message to all connected agents."""
-    msg_str = json.dumps(message)
-    for aid, info in agents.items():
-        if aid != exclude:
-            try:
-                await info["websocket"].send(msg_str)
-            except:
-                pass
+    msg_str = json_dumps(message)
+    connections = [
+        info["websocket"]
+        for aid, info in agents.items()
+        if aid != exclude
+    ]
+    # Writes to every connection without a coroutine per send;
+    # closed connections are skipped
+    ws_broadcast(connections, msg_str)
 
 
 async def main():